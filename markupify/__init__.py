@@ -1,4 +1,24 @@
+from markupify import tags as _tags
+from markupify.builder import DocumentBuilder  # noqa
 from markupify.page import HTMLPage  # noqa
-from markupify.tags import *  # noqa
+from markupify.tags import __all__ as _tag_names
 
 __version__ = "0.0.1"
+
+__all__ = ["DocumentBuilder", "HTMLPage", *_tag_names]
+
+
+def __getattr__(name: str):
+    """
+    Forward tag lookups to markupify.tags, keeping classes lazy.
+    """
+    if name in _tag_names:
+        return getattr(_tags, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    """
+    List package attributes including lazily materialized tag classes.
+    """
+    return sorted(set(globals()) | set(__all__))
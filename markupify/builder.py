@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import sys
+from typing import Optional
+
+from .tags import Element
+
+#: Marker stored in the tag-name column for text-only nodes.
+_TEXT_NODE = None
+
+
+class DocumentBuilder:
+    """
+    Flat-buffer document representation for bulk serialization.
+
+    Nodes live in parallel lists indexed by an integer id instead of
+    linked Element objects, so serialization is one sweep over
+    contiguous arrays rather than a pointer chase. The Element API
+    stays the ergonomic front door; this is the fast path for code
+    that mass-produces nodes.
+
+    Methods:
+        add_element: Append an element node and return its id.
+        add_text: Append a text node and return its id.
+        from_element: Build a DocumentBuilder from an Element tree.
+        render: Serialize the document to an HTML string.
+    """
+
+    __slots__ = ("tag_names", "props", "text", "children", "has_end", "roots")
+
+    def __init__(self) -> None:
+        """
+        Initialize the empty parallel node arrays.
+
+        Attributes:
+            tag_names (list): Tag name per node, None for text nodes.
+            props (list): Pre-escaped property string per node.
+            text (list): Leading text content per node.
+            children (list): Child id list per node.
+            has_end (list): End-tag flag per node.
+            roots (list): Ids of the top-level nodes, in document order.
+        """
+        self.tag_names: list = []
+        self.props: list = []
+        self.text: list = []
+        self.children: list = []
+        self.has_end: list = []
+        self.roots: list = []
+
+    def add_element(
+        self,
+        tag_name: str,
+        parent: Optional[int] = None,
+        props: str = "",
+        text: str = "",
+        has_end_tag: bool = True,
+    ) -> int:
+        """
+        Append an element node to the document.
+
+        Args:
+            tag_name (str): The tag name.
+            parent (int, optional): The id of the parent node, or None
+                for a top-level node (Defaults to None).
+            props (str, optional): The pre-escaped property string, as
+                produced by Element.props (Defaults to "").
+            text (str, optional): Text emitted before any children
+                (Defaults to "").
+            has_end_tag (bool, optional): Whether the tag is closed
+                with an end tag (Defaults to True).
+
+        Returns:
+            int: The id of the new node.
+        """
+        node = len(self.tag_names)
+        self.tag_names.append(sys.intern(tag_name.lower()))
+        self.props.append(props)
+        self.text.append(text)
+        self.children.append([])
+        self.has_end.append(has_end_tag)
+        if parent is None:
+            self.roots.append(node)
+        else:
+            self.children[parent].append(node)
+        return node
+
+    def add_text(self, content: str, parent: Optional[int] = None) -> int:
+        """
+        Append a text node to the document.
+
+        Args:
+            content (str): The text content.
+            parent (int, optional): The id of the parent node, or None
+                for a top-level node (Defaults to None).
+
+        Returns:
+            int: The id of the new node.
+        """
+        node = len(self.tag_names)
+        self.tag_names.append(_TEXT_NODE)
+        self.props.append("")
+        self.text.append(content)
+        self.children.append([])
+        self.has_end.append(False)
+        if parent is None:
+            self.roots.append(node)
+        else:
+            self.children[parent].append(node)
+        return node
+
+    @classmethod
+    def from_element(cls, element: Element) -> "DocumentBuilder":
+        """
+        Build a DocumentBuilder from an existing Element tree.
+
+        Args:
+            element (Element): The root element to convert.
+
+        Returns:
+            DocumentBuilder: A flat document equivalent to the tree.
+        """
+        builder = cls()
+        builder._adopt(element, None)
+        return builder
+
+    def _adopt(self, element: Element, parent: Optional[int]) -> None:
+        """
+        Recursively copy one Element subtree into the node arrays.
+
+        Args:
+            element (Element): The element to copy.
+            parent (int, optional): The id of the parent node.
+        """
+        node = self.add_element(
+            element.tag_name,
+            parent,
+            element.props,
+            element.tag_content,
+            element.has_end_tag,
+        )
+        for child in element.children:
+            if type(child) is str:
+                self.add_text(child, node)
+            else:
+                self._adopt(child, node)
+
+    def render(self) -> str:
+        """
+        Serialize the document to an HTML string.
+
+        The walk is iterative with an explicit stack, so arbitrarily
+        deep documents render without recursion, and every fragment
+        goes into one list joined once at the end.
+
+        Returns:
+            str: The HTML content of the document.
+        """
+        tag_names = self.tag_names
+        props = self.props
+        text = self.text
+        children = self.children
+        has_end = self.has_end
+
+        parts: list = []
+        append = parts.append
+        # The stack holds node ids to open and literal close-tag
+        # strings left behind to emit after a node's subtree.
+        stack: list = list(reversed(self.roots))
+        pop = stack.pop
+        while stack:
+            item = pop()
+            if type(item) is str:
+                append(item)
+                continue
+            tag = tag_names[item]
+            if tag is _TEXT_NODE:
+                append(text[item])
+                continue
+            prop = props[item]
+            head = f"<{tag} {prop}" if prop else f"<{tag}"
+            if not has_end[item]:
+                append(f"{head} />")
+                continue
+            append(f"{head}>")
+            node_text = text[item]
+            if node_text:
+                append(node_text)
+            stack.append(f"</{tag}>")
+            stack.extend(reversed(children[item]))
+        return "".join(parts)
+
+    __str__ = render
+    __repr__ = render
@@ -1,9 +1,86 @@
-from typing import Optional, Union
+from __future__ import annotations
 
-from bs4 import BeautifulSoup
+import re
+import threading
+from io import StringIO
+from typing import Callable, Optional, Union
 
 from .tags import Body, DocType, Element, Head, Html
 
+#: Dynamic slots in a compiled page look like "{name}" in the content.
+_PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+#: One pass over raw markup: groups are close-slash, tag name,
+#: attributes and self-close-slash.
+_TAG_RE = re.compile(r"<(/?)([!a-zA-Z][^\s/>]*)([^>]*?)(/?)>")
+
+
+def _pretty_markup(html_content: str, indent: int = 4) -> str:
+    """
+    Prettify raw markup with a single regex scan.
+
+    Args:
+        html_content (str): The HTML content to be prettified.
+        indent (int, optional): Spaces per indentation level (Defaults to 4).
+
+    Returns:
+        str: The prettified HTML content.
+    """
+    lines = []
+    level = 0
+    position = 0
+    pad = " " * indent
+    for match in _TAG_RE.finditer(html_content):
+        start = match.start()
+        text = html_content[position:start].strip()
+        if text:
+            lines.append(f"{pad * level}{text}")
+        closing, name, _, self_closing = match.groups()
+        if closing:
+            level = max(level - 1, 0)
+            lines.append(f"{pad * level}{match.group(0)}")
+        elif self_closing or name.startswith("!"):
+            lines.append(f"{pad * level}{match.group(0)}")
+        else:
+            lines.append(f"{pad * level}{match.group(0)}")
+            level += 1
+        position = match.end()
+    trailing = html_content[position:].strip()
+    if trailing:
+        lines.append(f"{pad * level}{trailing}")
+    return "\n".join(lines)
+
+
+#: Reusable render buffers; bounded so idle processes do not hoard them,
+#: and oversized buffers are dropped rather than pinned forever.
+_BUF_POOL: list = []
+_BUF_LOCK = threading.Lock()
+_BUF_POOL_MAX = 32
+_BUF_MAX_CAPACITY = 512 * 1024
+
+
+def _acquire_buffer() -> StringIO:
+    """
+    Take a buffer from the pool, or allocate one if the pool is empty.
+    """
+    with _BUF_LOCK:
+        if _BUF_POOL:
+            return _BUF_POOL.pop()
+    return StringIO()
+
+
+def _release_buffer(buf: StringIO) -> None:
+    """
+    Reset a buffer and return it to the pool if there is room.
+    """
+    if buf.tell() > _BUF_MAX_CAPACITY:
+        return
+    buf.seek(0)
+    buf.truncate(0)
+    with _BUF_LOCK:
+        if len(_BUF_POOL) < _BUF_POOL_MAX:
+            _BUF_POOL.append(buf)
+
 
 class HTMLPage:
     """
@@ -29,6 +106,19 @@ class HTMLPage:
         add_body: Add tags to the body section.
     """
 
+    __slots__ = (
+        "lang",
+        "template",
+        "head",
+        "body",
+        "_prefix",
+        "_suffix",
+        "_dirty",
+        "_cached",
+        "_compiled",
+        "_compiled_source",
+    )
+
     def __init__(
         self,
         head: Optional[Head] = "",
@@ -50,35 +140,98 @@ class HTMLPage:
         """
         self.lang: str = lang
         self.template: str = "{doc_type}{html}"
-        self.head: Head = self.set_head(head) if not bool(head) else Head()
-        self.body: Body = self.set_body(body) if not bool(body) else Body()
+        # The doctype and <html> shell are fixed once lang is known.
+        self._prefix: str = f'<!DOCTYPE html><html lang="{lang}">'
+        self._suffix: str = "</html>"
+        self._dirty: bool = True
+        # _dirty starts True, so the empty sentinel is never returned.
+        self._cached: str = ""
+        self._compiled: Optional[Callable[..., str]] = None
+        self._compiled_source: Optional[str] = None
+        # Already-built sections are adopted as-is; anything else is
+        # wrapped (or replaced by an empty section when falsy).
+        if isinstance(head, Head):
+            self.head: Head = head
+        else:
+            self.head = self.set_head(head) if head else self.set_head()
+        if isinstance(body, Body):
+            self.body: Body = body
+        else:
+            self.body = self.set_body(body) if body else self.set_body()
 
-    def __str__(self) -> str:
+    def render(self) -> str:
         """
-        Return a string representation of the HTMLPage.
+        Render the HTML content of the page.
 
         Returns:
             str: The HTML content of the page.
         """
-        return self.render()
-
-    def __repr__(self) -> str:
+        if not self._dirty:
+            return self._cached
+        buffer = _acquire_buffer()
+        try:
+            self._render_into(buffer.write)
+            self._cached = buffer.getvalue()
+        finally:
+            _release_buffer(buffer)
+        self._dirty = False
+        return self._cached
+
+    def _render_into(self, write: Callable[[str], object]) -> None:
         """
-        Return a string representation of the HTMLPage.
+        Write the rendered fragments of the page into a shared buffer.
 
-        Returns:
-            str: The HTML content of the page.
+        Args:
+            write: A callable accepting a string fragment, typically
+                the bound write method of an io.StringIO.
         """
-        return self.render()
+        write(self._prefix)
+        self.head.render_into(write)
+        self.body.render_into(write)
+        write(self._suffix)
 
-    def render(self) -> str:
+    # Point __str__/__repr__ straight at render to skip a wrapper frame
+    # per stringification.
+    __str__ = render
+    __repr__ = render
+
+    def compile(self) -> Callable[..., str]:
         """
-        Render the HTML content of the page.
+        Compile the page to a function specialized on its tag tree.
+
+        The rendered page is partially evaluated: static substrings are
+        frozen as constants and every "{name}" placeholder becomes a
+        keyword argument of the generated function, so repeated renders
+        of the same structure collapse to a single join.
 
         Returns:
-            str: The HTML content of the page.
+            Callable[..., str]: A function returning the HTML content,
+            taking one keyword argument per placeholder.
         """
-        return self.template.format(doc_type=self.doc_type, html=self.html)
+        source = self.render()
+        if self._compiled is not None and self._compiled_source == source:
+            return self._compiled
+
+        fragments = []
+        position = 0
+        for match in _PLACEHOLDER_PATTERN.finditer(source):
+            start = match.start()
+            if start > position:
+                fragments.append(repr(source[position:start]))
+            fragments.append(f"str(kwargs[{match.group(1)!r}])")
+            position = match.end()
+        if position < len(source):
+            fragments.append(repr(source[position:]))
+
+        body = ", ".join(fragments) or "''"
+        namespace: dict = {}
+        exec(
+            f"def _render(**kwargs):\n    return ''.join(({body},))\n",
+            namespace,
+        )
+        self._compiled = namespace["_render"]
+        self._compiled_source = source
+        return self._compiled
 
     @property
     def doc_type(self) -> DocType:
@@ -99,10 +252,7 @@ class HTMLPage:
         Returns:
             Html: The Html element of the HTML page.
         """
-        html = Html(
-            tag_content=f"{self.head}{self.body}",
-            lang=self.lang,
-        )
+        html = Html(self.head, self.body, lang=self.lang)
         return html
 
     def set_head(self, *args, **props) -> Head:
@@ -116,10 +266,8 @@ class HTMLPage:
         Returns:
             Head: The Head element of the HTML page.
         """
-        content = ""
-        for tag in args:
-            content += str(tag)
-        self.head = Head(tag_content=content, **props)
+        self._dirty = True
+        self.head = Head(*args, **props)
         return self.head
 
     def set_body(self, *args, **props) -> Body:
@@ -133,10 +281,8 @@ class HTMLPage:
         Returns:
             Body: The Body element of the HTML page.
         """
-        content = ""
-        for tag in args:
-            content += str(tag)
-        self.body = Body(tag_content=content, **props)
+        self._dirty = True
+        self.body = Body(*args, **props)
         return self.body
 
     def pretty(
@@ -150,17 +296,21 @@ class HTMLPage:
 
         Args:
             html_content (str, optional): The HTML content to be prettified (Defaults to "").
-            encoding: Encoding to use for prettifying (Defaults to None).
-            formatter (str, optional): The formatter to use for prettifying (Defaults to "minimal").
+            encoding: Unused, kept for API compatibility (Defaults to None).
+            formatter (str, optional): Unused, kept for API compatibility (Defaults to "minimal").
 
         Returns:
             str: The prettified HTML content.
         """
-        if not html_content:
-            html_content = self.render()
+        if html_content:
+            # Raw markup has no tree to walk, so tokenize it instead.
+            return _pretty_markup(str(html_content))
 
-        soup = BeautifulSoup(html_content, "html.parser")
-        return soup.prettify(encoding, formatter)
+        buf = ["<!DOCTYPE html>", f'<html lang="{self.lang}">']
+        self.head.pretty_into(buf, 4, 1)
+        self.body.pretty_into(buf, 4, 1)
+        buf.append("</html>")
+        return "\n".join(buf)
 
     def add_tag_to_head(self, *args) -> Head:
         """
@@ -169,8 +319,8 @@ class HTMLPage:
         Args:
             *args (str, Element): The list of contents to be added to the head section.
         """
-        for tag in args:
-            self.head.tag_content += str(tag)
+        self._dirty = True
+        self.head.add_content(*args)
         return self.head
 
     def add_tag_to_body(self, *args) -> Body:
@@ -180,8 +330,8 @@ class HTMLPage:
         Args:
             *args (str, Element): The list of contents to be added to the body section.
         """
-        for tag in args:
-            self.body.tag_content += str(tag)
+        self._dirty = True
+        self.body.add_content(*args)
         return self.body
 
     def write(self, filename: str):
@@ -1,18 +1,141 @@
-from typing import Iterable, Optional, Union
+from __future__ import annotations
+
+import sys
+from collections import deque
+from functools import lru_cache
+from html import escape
+from typing import Callable, Optional, Union
+
+_BR_STR = "<br />"
+_HR_STR = "<hr />"
+
+#: Upper bound on content length for the shared render cache; bigger
+#: contents are unlikely to repeat and would only evict useful entries.
+_RENDER_CACHE_MAX_CONTENT = 256
+
+#: Upper bound on released instances kept per tag class.
+_POOL_MAX = 64
+
+#: Shared read-only stand-in for "no properties". Most elements never
+#: get attributes, so they all alias this dict instead of allocating
+#: one each; mutators copy-on-write before the first insert.
+_EMPTY_PROPS: dict = {}
+
+_UNDERSCORE = str.maketrans("_", "-")
+
+#: Memoized keyword-argument -> HTML attribute names. The universe of
+#: names seen in practice (data_id, aria_label, class_, ...) is tiny
+#: and repetitive, so a plain dict beats an lru_cache wrapper call.
+_HYPHEN_CACHE: dict = {}
+
+#: Memoized raw -> normalized tag names for dynamically named tags;
+#: HTML has well under 200 tag names, so this stays tiny.
+_TAG_NAME_CACHE: dict = {}
+
+#: Memoized escaped attribute values; bounded, since values are less
+#: repetitive than names. Entries past the cap are escaped uncached.
+_ATTR_ESCAPE_CACHE: dict = {}
+_ATTR_ESCAPE_CACHE_MAX = 4096
+
+#: Dedup table for short string children (bullets, separators, cell
+#: fillers) repeated across thousands of elements.
+_CONTENT_INTERN: dict = {}
+_CONTENT_INTERN_MAX = 8192
+_CONTENT_INTERN_MAX_LEN = 64
+
+
+def _intern_content(text: str) -> str:
+    """
+    Alias identical short content strings to shared storage.
+    """
+    cached = _CONTENT_INTERN.get(text)
+    if cached is None:
+        if (
+            len(text) > _CONTENT_INTERN_MAX_LEN
+            or len(_CONTENT_INTERN) >= _CONTENT_INTERN_MAX
+        ):
+            return text
+        cached = _CONTENT_INTERN.setdefault(text, text)
+    return cached
+
+
+def _escape_attr(value: object) -> str:
+    """
+    Escape an attribute value for double-quoted emission, memoized.
+    """
+    text = value if type(value) is str else str(value)
+    cached = _ATTR_ESCAPE_CACHE.get(text)
+    if cached is None:
+        cached = escape(text, quote=True)
+        if len(_ATTR_ESCAPE_CACHE) < _ATTR_ESCAPE_CACHE_MAX:
+            _ATTR_ESCAPE_CACHE[text] = cached
+    return cached
+
+
+def _normalize_tag_name(tag_name: str) -> str:
+    """
+    Lowercase and intern a tag name, memoizing the result.
+    """
+    cached = _TAG_NAME_CACHE.get(tag_name)
+    if cached is None:
+        cached = _TAG_NAME_CACHE.setdefault(
+            tag_name, sys.intern(tag_name.lower())
+        )
+    return cached
+
+
+def _attr_name(name: str) -> str:
+    """
+    Turn a keyword-argument name into its HTML attribute form.
+    """
+    cached = _HYPHEN_CACHE.get(name)
+    if cached is None:
+        # Interned names hit the unicode identity fast path when the
+        # property dict is probed or deduplicated downstream.
+        cached = _HYPHEN_CACHE.setdefault(
+            name, sys.intern(name.strip("_").translate(_UNDERSCORE))
+        )
+    return cached
+
+
+@lru_cache(maxsize=1024)
+def _render_cached(
+    tag_name: str, has_end_tag: bool, tag_content: str, props: str
+) -> str:
+    """
+    Build the HTML string for a tag, memoized across identical tags.
+
+    Repeated identical tags (empty <td></td>, <li> items with static
+    text, void tags) share one interned result string.
+    """
+    props_part = f" {props}" if props else ""
+    if has_end_tag:
+        return "".join(
+            (
+                "<",
+                tag_name,
+                props_part,
+                ">",
+                tag_content,
+                "</",
+                tag_name,
+                ">",
+            )
+        )
+    return "".join(("<", tag_name, props_part, " />"))
 
 
 class Element:
     """
     The base class to make an HTML element.
 
-    Args:
-        tag_name (str): The tag name.
-        has_end_tag (bool, optional): If set to False, the tag will not contain content and end tag. Default: True.
-        *tags (str or Element): The list of tags to make content of the tag.
-        **props: Properties for the tag.
+    Attributes:
+        TAG_NAME (str): The tag name, set once per subclass.
+        HAS_END_TAG (bool): If set to False, the tag will not contain content and end tag. Default: True.
 
     Methods:
         __init__: Initialize the Element instance.
+        __init_subclass__: Normalize the TAG_NAME of a subclass once.
         __str__: Return a string representation of the Element.
         __repr__: Return a string representation of the Element.
         __add__: Concatenate tag content when using the addition operator.
@@ -25,111 +148,446 @@ class Element:
         text: Get the text content of the tag.
     """
 
+    # Slots declared hot-first: render touches _rendered, the tag
+    # fields, children and _props on every walk, while properties and
+    # _style_parts are only read during construction.
+    __slots__ = (
+        "_rendered",
+        "tag_name",
+        "has_end_tag",
+        "tag_content",
+        "children",
+        "_props",
+        "properties",
+        "_style_parts",
+    )
+
+    TAG_NAME: str = "div"
+    HAS_END_TAG: bool = True
+    _OPEN_PREFIX: str = "<div"
+    _CLOSE_TAG: str = "</div>"
+    _pool: deque = deque(maxlen=_POOL_MAX)
+
+    # Slot types, kept precise so the module stays within the subset
+    # that ahead-of-time compilers (mypyc and friends) accept.
+    tag_name: str
+    has_end_tag: bool
+    tag_content: str
+    children: list
+    properties: dict
+    _props: dict
+    _style_parts: list
+    _rendered: Optional[str]
+
+    def __init_subclass__(
+        cls,
+        tag_name: Optional[str] = None,
+        has_end_tag: Optional[bool] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Normalize the TAG_NAME of a subclass once at class creation.
+
+        Subclasses may pass their fixed parameters as class keywords
+        (class Li(Element, tag_name="li")) instead of defining a
+        forwarding __init__.
+
+        Args:
+            tag_name (str, optional): The fixed tag name of the subclass.
+            has_end_tag (bool, optional): Whether the tag has an end part.
+        """
+        super().__init_subclass__(**kwargs)
+        if tag_name is not None:
+            cls.TAG_NAME = tag_name
+        if has_end_tag is not None:
+            cls.HAS_END_TAG = has_end_tag
+        # Interning means every instance of a subclass shares one tag
+        # name string and downstream dict lookups compare by identity.
+        cls.TAG_NAME = sys.intern(cls.TAG_NAME.lower())
+        # Partial evaluation: the open/close fragments are constant per
+        # tag, so build them once here instead of per render.
+        cls._OPEN_PREFIX = sys.intern(f"<{cls.TAG_NAME}")
+        cls._CLOSE_TAG = sys.intern(f"</{cls.TAG_NAME}>")
+        # Each class keeps its own bounded pool of released instances;
+        # the deque drops overflow at C level instead of a len() check.
+        cls._pool = deque(maxlen=_POOL_MAX)
+        if "render" in cls.__dict__:
+            # Keep __str__/__repr__ pointing at the overriding render.
+            cls.__str__ = cls.__repr__ = cls.__dict__["render"]
+
     def __init__(
         self,
-        tag_name: Optional[str] = "div",
-        has_end_tag: Optional[bool] = True,
-        *tags: Optional[str, "Element"],
+        *tags: Union[str, "Element"],
+        tag_name: Optional[str] = None,
+        has_end_tag: Optional[bool] = None,
+        tag_content: Union[str, "Element"] = "",
+        children: Optional[list] = None,
         **props: object,
     ) -> None:
         """
         Initialize the Element instance.
 
         Args:
-            tag_name (str, optional): The tag name. Defaults to "div".
-            has_end_tag (bool, optional): If set to False, the tag will not contain content and end tag. Default: True.
             *tags (str or Element): The list of tags to make content of the tag. Defaults to "".
+            tag_name (str, optional): The tag name. Defaults to the class-level TAG_NAME.
+            has_end_tag (bool, optional): If set to False, the tag will not contain content and end tag.
+                Defaults to the class-level HAS_END_TAG.
+            tag_content (str or Element, optional): The content of the tag. Defaults to "".
+            children (list, optional): A pre-built child list, adopted as-is
+                so bulk builders skip the *tags tuple packing. Defaults to None.
             **props: Properties for the tag.
         """
-        if not has_end_tag and tags:
+        cls = type(self)
+        self.tag_name = (
+            _normalize_tag_name(tag_name) if tag_name else cls.TAG_NAME
+        )
+        self.has_end_tag = (
+            cls.HAS_END_TAG if has_end_tag is None else has_end_tag
+        )
+
+        if not self.has_end_tag and (tags or children or tag_content):
             raise ValueError(
                 "Tags without end parts cannot contain content. "
                 "Set has_end_tag to True or leave blank the *tags."
             )
 
-        self.tag_name = tag_name.lower()
-        self.has_end_tag = has_end_tag
-        self.tag_content = "".join(tags)
+        self.tag_content = str(tag_content)
+        if children is not None:
+            # The caller's list is adopted, not copied; it must not be
+            # mutated behind the element's back afterwards.
+            if tags:
+                raise ValueError(
+                    "Pass content either as *tags or as children=, "
+                    "not both."
+                )
+            self.children = children
+        elif tags and len(tags) <= 4:
+            self.children = [
+                _intern_content(tag) if type(tag) is str else tag
+                for tag in tags
+            ]
+        else:
+            self.children = list(tags)
         self.properties = props
 
-        self.props = ""
-        self.style = ""
+        self._props = _EMPTY_PROPS
+        self._style_parts = []
+        self._rendered = None
+
+        if props:
+            self._apply_props(props)
 
-        style_property = self.properties.pop("style", None)
-        if style_property:
-            if isinstance(style_property, str):
-                self.style += style_property
-            elif isinstance(style_property, dict):
+    def _apply_props(self, props: dict) -> None:
+        """
+        Normalize the style entry and remaining properties in one pass.
+
+        Args:
+            props (dict): Properties for the tag; consumed in place.
+        """
+        if "style" in props:
+            style_property = props.pop("style")
+            # Style input is always a concrete str or dict, so a
+            # pointer compare beats the isinstance MRO walk here.
+            style_type = type(style_property)
+            if style_type is str:
+                if style_property:
+                    self._style_parts.append(style_property)
+            elif style_type is dict:
                 self.add_styles(**style_property)
-            else:
+            elif style_property is not None:
                 raise TypeError("style property must be string or dict.")
+            if self._style_parts:
+                self.add_property("style", self.style)
+        if props:
+            self.add_properties(**props)
 
-        if self.style:
-            self.add_property("style", self.style)
-        self.add_properties(**self.properties)
-
-    def __str__(self) -> str:
+    def __add__(self, other: Union[str, "Element"]) -> "Element":
         """
-        Return a string representation of the Element.
+        Concatenate tag content when using the addition operator.
+
+        Args:
+            other: The content to concatenate with the current tag content.
 
         Returns:
-            str: The string representation of the Element.
+            Element: A new Element instance with concatenated tag content.
         """
-        return self.render()
+        # Clone the already-normalized state instead of re-running
+        # __init__, which would re-hyphenate every property and drop
+        # the style attribute popped from properties.
+        result = object.__new__(type(self))
+        result.tag_name = self.tag_name
+        result.has_end_tag = self.has_end_tag
+        result.tag_content = self.tag_content
+        result.children = self.children + [other]
+        result.properties = self.properties
+        result._props = dict(self._props) if self._props else _EMPTY_PROPS
+        result._style_parts = self._style_parts[:]
+        result._rendered = None
+        return result
 
-    def __repr__(self) -> str:
+    def render(self) -> str:
         """
-        Return a string representation of the Element.
+        Render the HTML content of the tag.
 
         Returns:
-            str: The string representation of the Element.
+            str: The HTML content of the tag.
+        """
+        rendered = self._rendered
+        if rendered is not None:
+            return rendered
+        tag_name = self.tag_name
+        tag_content = self.tag_content
+        children = self.children
+        if children:
+            tag_content += "".join(
+                child if type(child) is str else str(child)
+                for child in children
+            )
+        prop_map = self._props
+        props = (
+            " ".join(f'{k}="{v}"' for k, v in prop_map.items())
+            if prop_map
+            else ""
+        )
+        has_end_tag = self.has_end_tag
+        if len(tag_content) <= _RENDER_CACHE_MAX_CONTENT:
+            result = _render_cached(tag_name, has_end_tag, tag_content, props)
+        else:
+            cls = type(self)
+            if tag_name is cls.TAG_NAME:
+                open_prefix = cls._OPEN_PREFIX
+                close_tag = cls._CLOSE_TAG
+            else:
+                open_prefix = f"<{tag_name}"
+                close_tag = f"</{tag_name}>"
+            props_part = f" {props}" if props else ""
+            if has_end_tag:
+                result = "".join(
+                    (open_prefix, props_part, ">", tag_content, close_tag)
+                )
+            else:
+                result = "".join((open_prefix, props_part, " />"))
+        if not children:
+            # A child mutated behind our back could not invalidate the
+            # parent, so only leaf elements memoize their output.
+            self._rendered = result
+        return result
+
+    # Point __str__/__repr__ straight at render to skip a wrapper frame
+    # per stringification.
+    __str__ = render
+    __repr__ = render
+
+    def render_into(self, write: Callable[[str], object]) -> None:
+        """
+        Write the rendered fragments of the tag into a shared buffer.
+
+        Streaming the fragments avoids allocating one intermediate
+        string per tag when a whole tree is rendered.
+
+        Args:
+            write: A callable accepting a string fragment, typically
+                the bound write method of an io.StringIO.
+        """
+        cls = type(self)
+        if self.tag_name is cls.TAG_NAME:
+            open_prefix = cls._OPEN_PREFIX
+            close_tag = cls._CLOSE_TAG
+        else:
+            open_prefix = f"<{self.tag_name}"
+            close_tag = f"</{self.tag_name}>"
+        write(open_prefix)
+        props = " ".join(f'{k}="{v}"' for k, v in self._props.items())
+        if props:
+            write(" ")
+            write(props)
+        if self.has_end_tag:
+            write(">")
+            if self.tag_content:
+                write(self.tag_content)
+            for child in self.children:
+                if isinstance(child, Element):
+                    child.render_into(write)
+                else:
+                    write(child if type(child) is str else str(child))
+            write(close_tag)
+        else:
+            write(" />")
+
+    def write(self, out) -> None:
         """
-        return self.render()
+        Stream the rendered tag straight to a file-like object.
 
-    def __add__(self, other: Union[str, "Element"]) -> "Element":
+        The full document string is never materialized, so memory
+        stays bounded regardless of tree size.
+
+        Args:
+            out: Any object with a write(str) method, such as an open
+                text file, an io.StringIO or a response stream.
         """
-        Concatenate tag content when using the addition operator.
+        self.render_into(out.write)
+
+    @classmethod
+    def acquire(cls, *tags: Union[str, "Element"], **props: object):
+        """
+        Take an instance from the class pool, or build a fresh one.
+
+        Opt-in counterpart to release() for tight loops that construct
+        and discard many transient elements.
 
         Args:
-            other: The content to concatenate with the current tag content.
+            *tags (str, Element): The list of tags to make content of the tag.
+            **props: Properties for the tag.
 
         Returns:
-            Element: A new Element instance with concatenated tag content.
+            Element: A reinitialized instance of this class.
         """
-        new_tag_content = str(self.tag_content) + str(other)
-        return Element(
-            tag_name=self.tag_name,
-            has_end_tag=self.has_end_tag,
-            tag_content=new_tag_content,
-            **self.properties,
-        )
+        pool = cls._pool
+        obj = pool.pop() if pool else cls.__new__(cls)
+        obj.__init__(*tags, **props)
+        return obj
 
-    def render(self) -> str:
+    @classmethod
+    def release(cls, obj: "Element") -> None:
         """
-        Render the HTML content of the tag.
+        Return an instance to the class pool for later reuse.
+
+        The caller must not keep references to a released instance.
+
+        Args:
+            obj (Element): The instance to recycle.
+        """
+        pool = cls._pool
+        if len(pool) < _POOL_MAX:
+            # Skip the field resets when the pool is already full.
+            # Drop references so recycled children can be collected.
+            obj.tag_content = ""
+            obj.children = []
+            obj.properties = {}
+            obj._props = _EMPTY_PROPS
+            obj._style_parts = []
+            obj._rendered = None
+            pool.append(obj)
+
+    @classmethod
+    def preallocate(cls, count: int) -> None:
+        """
+        Prime the class pool with blank instances up front.
+
+        Args:
+            count (int): The number of instances to add, clamped to the
+                pool bound.
+        """
+        pool = cls._pool
+        new = cls.__new__
+        for _ in range(min(count, _POOL_MAX) - len(pool)):
+            pool.append(new(cls))
+
+    def recycle(self) -> None:
+        """
+        Return this instance to its class pool for later reuse.
+
+        Shorthand for type(self).release(self); the caller must not
+        keep references to a recycled instance.
+        """
+        type(self).release(self)
+
+    def compile(self) -> Callable[[], str]:
+        """
+        Compile the element to a function specialized on its tag tree.
+
+        The tree is flattened once into literal fragments; callable
+        children are kept as holes evaluated per call, so a static
+        subtree collapses to returning one precomputed string and a
+        dynamic one to a single join.
 
         Returns:
-            str: The HTML content of the tag.
+            Callable[[], str]: A function returning the HTML content.
+        """
+        fragments: list = []
+        self._flatten_into(fragments)
+
+        # Merge runs of adjacent literals so the per-call join touches
+        # as few parts as possible.
+        parts: list = []
+        literals: list = []
+        for fragment in fragments:
+            if type(fragment) is str:
+                literals.append(fragment)
+            else:
+                if literals:
+                    parts.append("".join(literals))
+                    literals = []
+                parts.append(fragment)
+        if literals:
+            parts.append("".join(literals))
+
+        if len(parts) == 1 and type(parts[0]) is str:
+            static = parts[0]
+            return lambda: static
+
+        def _render() -> str:
+            return "".join(
+                part if type(part) is str else str(part()) for part in parts
+            )
+
+        return _render
+
+    def _flatten_into(self, fragments: list) -> None:
         """
-        structure = "<{tag_name}"
+        Append the element's fragments, keeping callable holes intact.
 
-        if self.props:
-            structure += " {props}"
-        if self.has_end_tag:
-            structure += ">"
+        Args:
+            fragments (list): The list of literal strings and callables.
+        """
+        props = " ".join(f'{k}="{v}"' for k, v in self._props.items())
+        head = f"<{self.tag_name} {props}" if props else f"<{self.tag_name}"
+        if not self.has_end_tag:
+            fragments.append(f"{head} />")
+            return
+        fragments.append(f"{head}>")
         if self.tag_content:
-            structure += "{tag_content}"
+            fragments.append(self.tag_content)
+        for child in self.children:
+            if isinstance(child, Element):
+                child._flatten_into(fragments)
+            elif callable(child):
+                fragments.append(child)
+            else:
+                fragments.append(child if type(child) is str else str(child))
+        fragments.append(f"</{self.tag_name}>")
 
-        if self.has_end_tag:
-            structure += "</{tag_name}>"
-        elif not self.has_end_tag:
-            structure += " />"
-
-        return structure.format(
-            tag_name=self.tag_name,
-            props=self.props.strip(),
-            tag_content=self.tag_content,
-        )
+    def pretty_into(self, buf: list, indent: int = 4, level: int = 0) -> None:
+        """
+        Append indented lines for the tag and its children to a buffer.
+
+        Walking the already-built tree avoids reparsing the rendered
+        HTML just to reformat it.
+
+        Args:
+            buf (list): The list of output lines to append to.
+            indent (int, optional): Spaces per indentation level (Defaults to 4).
+            level (int, optional): The current indentation level (Defaults to 0).
+        """
+        pad = " " * (indent * level)
+        props = " ".join(f'{k}="{v}"' for k, v in self._props.items())
+        head = f"<{self.tag_name} {props}" if props else f"<{self.tag_name}"
+        if not self.has_end_tag:
+            buf.append(f"{pad}{head} />")
+            return
+        if not self.children:
+            buf.append(f"{pad}{head}>{self.tag_content}</{self.tag_name}>")
+            return
+        buf.append(f"{pad}{head}>")
+        child_pad = " " * (indent * (level + 1))
+        if self.tag_content:
+            buf.append(f"{child_pad}{self.tag_content}")
+        for child in self.children:
+            if isinstance(child, Element):
+                child.pretty_into(buf, indent, level + 1)
+            else:
+                buf.append(f"{child_pad}{child}")
+        buf.append(f"{pad}</{self.tag_name}>")
 
     def add_property(self, name: str, value: str) -> None:
         """
@@ -139,7 +597,10 @@ class Element:
             name (str): The name of the property.
             value (str): The value of the property.
         """
-        self.props += f'{name}="{value}" '
+        self._rendered = None
+        if self._props is _EMPTY_PROPS:
+            self._props = {}
+        self._props[name] = _escape_attr(value)
 
     def add_properties(self, **props) -> None:
         """
@@ -148,10 +609,13 @@ class Element:
         Args:
             **props: Properties for the tag.
         """
+        self._rendered = None
+        if self._props is _EMPTY_PROPS:
+            self._props = {}
+        prop_map = self._props
+        cache_get = _HYPHEN_CACHE.get
         for name, value in props.items():
-            name = name.strip("_")
-            name = name.replace("_", "-")
-            self.add_property(name, value)
+            prop_map[cache_get(name) or _attr_name(name)] = _escape_attr(value)
 
     def add_style(self, name: str, value: str) -> None:
         """
@@ -161,7 +625,8 @@ class Element:
             name (str): The name of the style.
             value (str): The value of the style.
         """
-        self.style += f"{name}: {value};"
+        self._rendered = None
+        self._style_parts.append(f"{name}: {value};")
 
     def add_styles(self, **styles) -> None:
         """
@@ -170,10 +635,11 @@ class Element:
         Args:
             **styles: Styles for the tag.
         """
+        self._rendered = None
+        append = self._style_parts.append
+        cache_get = _HYPHEN_CACHE.get
         for name, value in styles.items():
-            name = name.strip("_")
-            name = name.replace("_", "-")
-            self.add_style(name, value)
+            append(f"{cache_get(name) or _attr_name(name)}: {value};")
 
     def add_content(self, *tags: Union[str, "Element"]) -> None:
         """
@@ -182,28 +648,56 @@ class Element:
         Args:
             *tags (str, Element): The list of tags to make content to be added to the tag.
         """
-        self.tag_content += "".join(tags)
+        self._rendered = None
+        self.children.extend(tags)
+
+    @property
+    def props(self) -> str:
+        """
+        Get the rendered property string of the tag.
+
+        Returns:
+            str: The space-separated property string.
+        """
+        return " ".join(f'{k}="{v}"' for k, v in self._props.items())
 
     @property
-    def text(self) -> [str, "Element"]:
+    def style(self) -> str:
+        """
+        Get the rendered inline style string of the tag.
+
+        Returns:
+            str: The accumulated style declarations.
+        """
+        return "".join(self._style_parts)
+
+    @property
+    def text(self) -> str:
         """
         Get the text content of the tag.
 
         Returns:
-            [str, 'Element']: The text content of the tag.
+            str: The text content of the tag.
         """
+        if self.children:
+            return self.tag_content + "".join(
+                child if type(child) is str else str(child)
+                for child in self.children
+            )
         return self.tag_content
 
 
-class A(Element):
+class A(Element, tag_name="a"):
     """
     Represents the <a> HTML element.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         link: str,
-        *tags: Union[Iterable[str], Iterable[Element]],
+        *tags: Union[str, Element],
         **props,
     ):
         """
@@ -214,2132 +708,570 @@ class A(Element):
             *tags (str, Element): The list of tags to make content to be added to the <a> tag.
             **props: Additional properties for the <a> tag.
         """
-        super().__init__(tag_name="a", *tags, href=link, **props)
+        super().__init__(*tags, href=link, **props)
 
 
-class Abbr(Element):
+class Br(Element, tag_name="br", has_end_tag=False):
     """
-    Represents the <abbr> HTML element.
+    Represents the <br> HTML element.
     """
 
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
+    __slots__ = ()
+
+    def render(self) -> str:
         """
-        Initialize the Abbr element.
+        Render the HTML content of the tag.
 
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <abbr> tag.
-            **props: Additional properties for the <abbr> tag.
+        Returns:
+            str: The pre-rendered "<br />" constant, or the attribute
+            form if properties were added.
         """
-        super().__init__(tag_name="abbr", *tags, **props)
+        if self._props:
+            return f"<br {self.props} />"
+        return _BR_STR
 
+    def render_into(self, write: Callable[[str], object]) -> None:
+        """
+        Write the rendered tag into a shared buffer.
+        """
+        write(self.render())
 
-class Address(Element):
+
+class Comment:
     """
-    Represents the <address> HTML element.
+    Represents an HTML comment.
     """
 
+    __slots__ = ("tag_content", "multiline", "_rendered")
+
     def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
+        self,
+        *tags: Union[str, Element],
     ):
         """
-        Initialize the Address element.
+        Initialize the Comment.
 
         Args:
-            *tags (str, Element): The list of tags to make content to be added to the <address> tag.
-            **props: Additional properties for the <address> tag.
+            *tags (str, Element): The list of tags to make content to be added to the comment.
         """
-        super().__init__(tag_name="address", *tags, **props)
+        self.tag_content = "".join(
+            tag if type(tag) is str else str(tag) for tag in tags
+        )
+        self.multiline = bool(len(tags) > 1)
+        # Comments are immutable after construction, so the rendered
+        # form is computed once here.
+        if self.multiline:
+            self._rendered = (
+                f"<!--\n                {self.tag_content}\n            -->"
+            )
+        else:
+            self._rendered = f"<!-- {self.tag_content} -->"
 
+    def render(self) -> str:
+        """
+        Render the comment.
 
-class Area(Element):
-    """
-    Represents the <area> HTML element.
-    """
+        Returns:
+            str: The rendered comment.
+        """
+        return self._rendered
 
-    def __init__(self, **props):
+    def write(self, out) -> None:
         """
-        Initialize the Area element.
+        Stream the rendered comment to a file-like object.
 
         Args:
-            **props: Additional properties for the <area> tag.
+            out: Any object with a write(str) method.
         """
-        super().__init__(tag_name="area", has_end_tag=False, **props)
+        out.write(self._rendered)
 
+    __str__ = render
+    __repr__ = render
 
-class Article(Element):
-    """
-    Represents the <article> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Article element.
 
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <article> tag.
-            **props: Additional properties for the <article> tag.
-        """
-        super().__init__(tag_name="article", *tags, **props)
+#: Shared DocType instances keyed by document type; "html" is the only
+#: realistic input, so one instance serves every page.
+_DOCTYPE_CACHE: dict = {}
 
 
-class Aside(Element):
+class DocType:
     """
-    Represents the <aside> HTML element.
+    Represents the document type declaration (DOCTYPE) of an HTML document.
     """
 
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
+    __slots__ = ("doc_type", "_rendered")
+
+    def __new__(cls, doc_type: str = "html") -> "DocType":
         """
-        Initialize the Aside element.
+        Return the shared DocType instance for the given type.
 
         Args:
-            *tags (str, Element): The list of tags to make content to be added to the <aside> tag.
-            **props: Additional properties for the <aside> tag.
+            doc_type (str, optional): The type of the document (Defaults to "html").
         """
-        super().__init__(tag_name="aside", *tags, **props)
+        instance = _DOCTYPE_CACHE.get(doc_type)
+        if instance is None:
+            instance = object.__new__(cls)
+            instance.doc_type = doc_type
+            instance._rendered = f"<!DOCTYPE {doc_type}>"
+            _DOCTYPE_CACHE[doc_type] = instance
+        return instance
 
+    def render(self) -> str:
+        """
+        Render the DocType.
 
-class Audio(Element):
-    """
-    Represents the <audio> HTML element.
-    """
+        Returns:
+            str: The rendered DocType.
+        """
+        return self._rendered
 
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
+    def write(self, out) -> None:
         """
-        Initialize the Audio element.
+        Stream the rendered DocType to a file-like object.
 
         Args:
-            *tags (str, Element): The list of tags to make content to be added to the <audio> tag.
-            **props: Additional properties for the <audio> tag.
+            out: Any object with a write(str) method.
         """
-        super().__init__(tag_name="audio", *tags, **props)
+        out.write(self._rendered)
 
+    __str__ = render
+    __repr__ = render
 
-class B(Element):
+
+def _make_headings() -> tuple:
     """
-    Represents the <b> HTML element.
+    Build the six heading classes, indexed by level (slot 0 unused).
     """
+    classes: list = [None]
+    for level in range(1, 7):
+        heading = type(
+            f"H{level}",
+            (Element,),
+            {
+                "__slots__": (),
+                "__doc__": (
+                    f"\n    Represents the <h{level}> HTML element.\n    "
+                ),
+                "TAG_NAME": f"h{level}",
+            },
+        )
+        globals()[f"H{level}"] = heading
+        classes.append(heading)
+    return tuple(classes)
 
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the B element.
 
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <b> tag.
-            **props: Additional properties for the <b> tag.
-        """
-        super().__init__(tag_name="b", *tags, **props)
+#: Pre-built heading classes, one per level, so the level check and
+#: tag name construction are paid once at import instead of per element.
+_H_CLASSES: tuple = _make_headings()
 
 
-class Base(Element):
+class H(Element):
     """
-    Represents the <base> HTML element.
+    Represents a heading (h1 - h6) HTML element.
+
+    Instantiating H dispatches to the matching pre-built H1-H6 class.
     """
 
-    def __init__(self, **props):
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        level: int = 1,
+        *tags: Union[str, Element],
+        **props,
+    ) -> Element:
         """
-        Initialize the Base element.
+        Create a heading element of the given level.
 
         Args:
-            **props: Additional properties for the <base> tag.
-        """
-        super().__init__(tag_name="base", has_end_tag=False, **props)
+            level (int): The level of the heading (1-6).
+            *tags (str, Element): The list of tags to make content to be added to the <h1>-<h6> tag.
+            **props: Additional properties for the heading tag.
 
+        Returns:
+            Element: An instance of the matching H1-H6 class.
+        """
+        try:
+            # Guard the index: level 0 maps to the unused None slot and
+            # negatives must not wrap around to the high headings.
+            tag_cls = _H_CLASSES[level] if level > 0 else None
+        except (IndexError, TypeError):
+            tag_cls = None
+        if tag_cls is None:
+            raise ValueError(
+                "The heading level must be an integer in range 1-6."
+            )
+        return tag_cls(*tags, **props)
 
-class Bdi(Element):
+
+class Hr(Element, tag_name="hr", has_end_tag=False):
     """
-    Represents the <bdi> HTML element.
+    Represents the <hr> HTML element.
     """
 
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
+    __slots__ = ()
+
+    def render(self) -> str:
         """
-        Initialize the Bdi element.
+        Render the HTML content of the tag.
 
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <bdi> tag.
-            **props: Additional properties for the <bdi> tag.
+        Returns:
+            str: The pre-rendered "<hr />" constant, or the attribute
+            form if properties were added.
+        """
+        if self._props:
+            return f"<hr {self.props} />"
+        return _HR_STR
+
+    def render_into(self, write: Callable[[str], object]) -> None:
+        """
+        Write the rendered tag into a shared buffer.
         """
-        super().__init__(tag_name="bdi", *tags, **props)
+        write(self.render())
 
 
-class Bdo(Element):
+class Style(Element, tag_name="style"):
     """
-    Represents the <bdo> HTML element.
+    Represents the <style> HTML element.
     """
 
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
+    __slots__ = ()
+
+    def __init__(self, **props):
         """
-        Initialize the Bdo element.
+        Initialize the Style element.
 
         Args:
-            *tags (str, Element): The list of tags to make content to be added to the <bdo> tag.
-            **props: Additional properties for the <bdo> tag.
+            **props: Additional properties for the <style> tag.
         """
-        super().__init__(tag_name="bdo", *tags, **props)
+        parts = []
+        for key, value in props.items():
+            value_type = type(value)
+            if value_type is dict:
+                declarations = "".join(
+                    f"{k.translate(_UNDERSCORE)}: {v};"
+                    for k, v in value.items()
+                )
+                parts.append(f"{key} {declarations}")
+            elif value_type is str:
+                parts.append(f"{key} {value}")
+            else:
+                raise TypeError("property must be string or dict.")
+        super().__init__(tag_content="".join(parts))
+
+
+#: (class name, tag name, has end tag) for every element that needs no
+#: behavior beyond Element itself; the classes are generated below.
+_TAG_TABLE: tuple = (
+    ("Abbr", "abbr", True),
+    ("Address", "address", True),
+    ("Area", "area", False),
+    ("Article", "article", True),
+    ("Aside", "aside", True),
+    ("Audio", "audio", True),
+    ("B", "b", True),
+    ("Base", "base", False),
+    ("Bdi", "bdi", True),
+    ("Bdo", "bdo", True),
+    ("BlockQuote", "blockquote", True),
+    ("Body", "body", True),
+    ("Button", "button", True),
+    ("Canvas", "canvas", True),
+    ("Caption", "caption", True),
+    ("Circle", "circle", False),
+    ("Cite", "cite", True),
+    ("Code", "code", True),
+    ("Col", "col", False),
+    ("ColGroup", "colgroup", True),
+    ("Data", "data", True),
+    ("DataIterable", "datalist", True),
+    ("Dd", "dd", True),
+    ("Defs", "defs", True),
+    ("Del", "del", True),
+    ("Details", "details", True),
+    ("Dfn", "dfn", True),
+    ("Dialog", "dialog", True),
+    ("Div", "div", True),
+    ("Dl", "dl", True),
+    ("Dt", "dt", True),
+    ("Ellipse", "ellipse", False),
+    ("Em", "em", True),
+    ("Embed", "embed", False),
+    ("FieldSet", "fieldset", True),
+    ("FigCaption", "figcaption", True),
+    ("Figure", "figure", True),
+    ("Footer", "footer", True),
+    ("Form", "form", True),
+    ("Head", "head", True),
+    ("Header", "header", True),
+    ("HGroup", "hgroup", True),
+    ("Html", "html", True),
+    ("I", "i", True),
+    ("IFrame", "iframe", True),
+    ("Img", "img", False),
+    ("Input", "input", False),
+    ("Ins", "ins", True),
+    ("Kbd", "kbd", True),
+    ("Label", "label", True),
+    ("Legend", "legend", True),
+    ("Li", "li", True),
+    ("LinearGradient", "linearGradient", True),
+    ("Link", "link", False),
+    ("Main", "main", True),
+    ("Map", "map", True),
+    ("Mark", "mark", True),
+    ("Menu", "menu", True),
+    ("Meta", "meta", False),
+    ("Meter", "meter", True),
+    ("Nav", "nav", True),
+    ("NoScript", "noscript", True),
+    ("Object", "object", True),
+    ("Ol", "ol", True),
+    ("OptGroup", "optgroup", True),
+    ("Option", "option", True),
+    ("Output", "output", True),
+    ("P", "p", True),
+    ("Param", "param", True),
+    ("Picture", "picture", True),
+    ("Polygon", "polygon", False),
+    ("Pre", "pre", True),
+    ("Progress", "progress", True),
+    ("Q", "q", True),
+    ("Rect", "rect", False),
+    ("Rp", "rp", True),
+    ("Rt", "rt", True),
+    ("Ruby", "ruby", True),
+    ("S", "s", True),
+    ("Samp", "samp", True),
+    ("Script", "script", True),
+    ("Search", "search", True),
+    ("Section", "section", True),
+    ("Select", "select", True),
+    ("Small", "small", True),
+    ("Source", "source", False),
+    ("Span", "span", True),
+    ("Stop", "stop", False),
+    ("Strong", "strong", True),
+    ("Sub", "sub", True),
+    ("Summary", "summary", True),
+    ("Sup", "sup", True),
+    ("Svg", "svg", True),
+    ("Table", "table", True),
+    ("TBody", "tbody", True),
+    ("Td", "td", True),
+    ("Template", "template", True),
+    ("Text", "text", True),
+    ("Textarea", "textarea", True),
+    ("TFoot", "tfoot", True),
+    ("Th", "th", True),
+    ("THead", "thead", True),
+    ("Time", "time", True),
+    ("Title", "title", True),
+    ("Tr", "tr", True),
+    ("Track", "track", True),
+    ("U", "u", True),
+    ("Ul", "ul", True),
+    ("Var", "var", True),
+    ("Video", "video", True),
+    ("Wbr", "wbr", True),
+)
+
+
+#: Tag name -> class for every known tag, filled by the factory below
+#: and extended lazily by Tag[...] lookups.
+_TAG_CLASS_REGISTRY: dict = {}
+
+
+def _void_init(self, **props: object) -> None:
+    """
+    Initialize a void element with direct slot assignments.
+
+    Void tags take no child content, so the generic positional and
+    keyword handling of Element.__init__ is skipped entirely.
+
+    Args:
+        **props: Properties for the tag.
+    """
+    self.tag_name = type(self).TAG_NAME
+    self.has_end_tag = False
+    self.tag_content = ""
+    self.children = []
+    self.properties = props
+    self._props = _EMPTY_PROPS
+    self._style_parts = []
+    self._rendered = None
+    if props:
+        # Match Element.__init__: content keywords never become
+        # attributes, and only truthy values are an error.
+        if props.pop("tag_content", None) or props.pop("children", None):
+            raise ValueError(
+                "Tags without end parts cannot contain content. "
+                "Set has_end_tag to True or leave blank the *tags."
+            )
+        if props:
+            self._apply_props(props)
 
 
-class BlockQuote(Element):
+def _void_render(self) -> str:
     """
-    Represents the <blockquote> HTML element.
+    Render a void tag, short-circuiting to a class-level constant.
+
+    Returns:
+        str: The precomputed bare form, or the attribute form if
+        properties were added.
     """
+    if self._props:
+        return f"<{self.tag_name} {self.props} />"
+    return type(self)._EMPTY_RENDER
 
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the BlockQuote element.
 
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <blockquote> tag.
-            **props: Additional properties for the <blockquote> tag.
-        """
-        super().__init__(tag_name="blockquote", *tags, **props)
+def _void_render_into(self, write: Callable[[str], object]) -> None:
+    """
+    Write a void tag into a shared buffer without end-tag branching.
+
+    Args:
+        write: A callable accepting a string fragment.
+    """
+    write(type(self)._OPEN_PREFIX)
+    props = self._props
+    if props:
+        write(" ")
+        write(" ".join(f'{k}="{v}"' for k, v in props.items()))
+    write(" />")
 
 
-class Body(Element):
+def _make_tag_class(name: str, tag_name: str, has_end_tag: bool) -> type:
     """
-    Represents the <body> HTML element.
+    Create one Element subclass with its tag name baked in.
     """
+    namespace = {
+        "__slots__": (),
+        "__doc__": f"\n    Represents the <{tag_name}> HTML element.\n    ",
+        "__module__": __name__,
+        "TAG_NAME": tag_name,
+        "HAS_END_TAG": has_end_tag,
+    }
+    if not has_end_tag:
+        # Void tags get branch-free construction and streaming paths,
+        # plus a constant rendered form for the common bare case.
+        namespace["__init__"] = _void_init
+        namespace["render"] = _void_render
+        namespace["render_into"] = _void_render_into
+        namespace["_EMPTY_RENDER"] = sys.intern(f"<{tag_name} />")
+    tag_cls = type(name, (Element,), namespace)
+    _TAG_CLASS_REGISTRY[tag_cls.TAG_NAME] = tag_cls
+    return tag_cls
 
-    def __init__(self, *tags: Union[str, "Element"], **props):
-        """
-        Initialize the Body element.
 
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <body> tag.
-            **props: Additional properties for the <body> tag.
-        """
-        super().__init__(tag_name="body", *tags, **props)
+#: Class names whose tag deliberately differs from the lowercased name.
+_TAG_ALIASES: dict = {"DataIterable": "datalist"}
 
+#: Lazy class specs: class name -> (tag name, has end tag). Classes are
+#: only materialized on first attribute access (PEP 562), so programs
+#: that touch three tags never pay for the other hundred.
+_TAG_SPECS: dict = {}
+for _name, _tag, _end in _TAG_TABLE:
+    # Guard against the copy-paste drift that once gave Object the
+    # <option> tag; aliases must be declared explicitly.
+    assert _name.lower() == _tag.lower() or _TAG_ALIASES.get(_name) == _tag, (
+        _name,
+        _tag,
+    )
+    _TAG_SPECS[_name] = (_tag, _end)
+del _name, _tag, _end
 
-class Br(Element):
-    """
-    Represents the <br> HTML element.
-    """
+#: Normalized tag name -> lazy class name, for Tag[...] lookups.
+_TAG_SPEC_BY_TAG: dict = {
+    spec[0].lower(): name for name, spec in _TAG_SPECS.items()
+}
 
-    def __init__(self):
-        """
-        Initialize the Br element.
-        """
-        super().__init__(tag_name="br", has_end_tag=False)
+for _cls in (A, Br, Hr, Style, *_H_CLASSES[1:]):
+    _TAG_CLASS_REGISTRY[_cls.TAG_NAME] = _cls
+del _cls
 
 
-class Button(Element):
+def __getattr__(name: str):
     """
-    Represents the <button> HTML element.
+    Materialize a generated tag class on first access (PEP 562).
     """
+    spec = _TAG_SPECS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tag_cls = _make_tag_class(name, spec[0], spec[1])
+    globals()[name] = tag_cls
+    return tag_cls
 
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Button element.
 
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <button> tag.
-            **props: Additional properties for the <button> tag.
-        """
-        super().__init__(tag_name="button", *tags, **props)
-
-
-class Canvas(Element):
-    """
-    Represents the <canvas> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Canvas element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <canvas> tag.
-            **props: Additional properties for the <canvas> tag.
-        """
-        super().__init__(tag_name="canvas", *tags, **props)
-
-
-class Caption(Element):
-    """
-    Represents the <caption> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Caption element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <caption> tag.
-            **props: Additional properties for the <caption> tag.
-        """
-        super().__init__(tag_name="caption", *tags, **props)
-
-
-class Circle(Element):
-    """
-    Represents the <circle> HTML element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Circle element.
-
-        Args:
-            **props: Additional properties for the <circle> tag.
-        """
-        super().__init__(tag_content="circle", has_end_tag=False, **props)
-
-
-class Cite(Element):
-    """
-    Represents the <cite> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Cite element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <cite> tag.
-            **props: Additional properties for the <cite> tag.
-        """
-        super().__init__(tag_name="cite", *tags, **props)
-
-
-class Code(Element):
-    """
-    Represents the <code> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Code element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <code> tag.
-            **props: Additional properties for the <code> tag.
-        """
-        super().__init__(tag_name="code", *tags, **props)
-
-
-class Col(Element):
-    """
-    Represents the <col> HTML element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Col element.
-
-        Args:
-            **props: Additional properties for the <col> tag.
-        """
-        super().__init__(tag_content="col", has_end_tag=False, **props)
-
-
-class ColGroup(Element):
-    """
-    Represents the <colgroup> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the ColGroup element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <colgroup> tag.
-            **props: Additional properties for the <colgroup> tag.
-        """
-        super().__init__(tag_name="colgroup", *tags, **props)
-
-
-class Comment:
-    """
-    Represents an HTML comment.
-    """
-
-    def __init__(
-        self,
-        *tags: Union[Iterable[str], Iterable[Element]],
-    ):
-        """
-        Initialize the Comment.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the comment.
-        """
-        self.tag_content = ""
-        for tag in tags:
-            self.tag_content += tag
-        self.multiline = bool(len(tags) > 1)
-
-    def __str__(self) -> str:
-        """
-        Return a string representation of the comment.
-
-        Returns:
-            str: The string representation of the comment.
-        """
-        return self.render()
-
-    def __repr__(self) -> str:
-        """
-        Return a string representation of the comment.
-
-        Returns:
-            str: The string representation of the comment.
-        """
-        return self.render()
-
-    def render(self) -> str:
-        """
-        Render the comment.
-
-        Returns:
-            str: The rendered comment.
-        """
-        if self.multiline:
-            return f"""
-            <!--
-                {self.tag_content}
-            -->
-            """.strip()
-        return f"<!-- {self.tag_content} -->"
-
-
-class Data(Element):
-    """
-    Represents the <data> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Data element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <data> tag.
-            **props: Additional properties for the <data> tag.
-        """
-        super().__init__(tag_name="data", *tags, **props)
-
-
-class DataIterable(Element):
-    """
-    Represents the <datalist> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the DataIterable element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <datalist> tag.
-            **props: Additional properties for the <datalist> tag.
-        """
-        super().__init__(tag_name="datalist", *tags, **props)
-
-
-class Dd(Element):
-    """
-    Represents the <dd> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Dd element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <dd> tag.
-            **props: Additional properties for the <dd> tag.
-        """
-        super().__init__(tag_name="dd", *tags, **props)
-
-
-class Defs(Element):
-    """
-    Represents the <defs> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Defs element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <defs> tag.
-            **props: Additional properties for the <defs> tag.
-        """
-        super().__init__(tag_name="defs", *tags, **props)
-
-
-class Del(Element):
-    """
-    Represents the <del> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Del element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <del> tag.
-            **props: Additional properties for the <del> tag.
-        """
-        super().__init__(tag_name="del", *tags, **props)
-
-
-class Details(Element):
-    """
-    Represents the <details> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Details element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <details> tag.
-            **props: Additional properties for the <details> tag.
-        """
-        super().__init__(tag_name="details", *tags, **props)
-
-
-class Dfn(Element):
-    """
-    Represents the <dfn> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Dfn element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <dfn> tag.
-            **props: Additional properties for the <dfn> tag.
-        """
-        super().__init__(tag_name="dfn", *tags, **props)
-
-
-class Dialog(Element):
+def __dir__() -> list:
     """
-    Represents the <dialog> HTML element.
+    List module attributes including not-yet-materialized classes.
     """
+    return sorted(set(globals()) | set(_TAG_SPECS))
 
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Dialog element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <dialog> tag.
-            **props: Additional properties for the <dialog> tag.
-        """
-        super().__init__(tag_name="dialog", *tags, **props)
 
-
-class Div(Element):
-    """
-    Represents the <div> HTML element.
+class Tag(Element):
     """
+    Dynamic access point for tag classes.
 
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Div element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <div> tag.
-            **props: Additional properties for the <div> tag.
-        """
-        super().__init__(tag_name="div", *tags, **props)
-
-
-class Dl(Element):
+    Tag["li"] returns the class rendering <li>, reusing the generated
+    classes and creating (then caching) one for unknown tag names, so
+    new specializations are only built on first use.
     """
-    Represents the <dl> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Dl element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <dl> tag.
-            **props: Additional properties for the <dl> tag.
-        """
-        super().__init__(tag_name="dl", *tags, **props)
 
+    __slots__ = ()
 
-class DocType:
-    """
-    Represents the document type declaration (DOCTYPE) of an HTML document.
-    """
-
-    def __init__(self, doc_type: str = "html"):
+    def __class_getitem__(cls, name: str) -> type:
         """
-        Initialize the DocType.
+        Get or create the tag class for a tag name.
 
         Args:
-            doc_type (str, optional): The type of the document (Defaults to "html").
-        """
-        self.doc_type = doc_type
-
-    def __str__(self) -> str:
-        """
-        Return a string representation of the DocType.
-
-        Returns:
-            str: The string representation of the DocType.
-        """
-        return self.render()
-
-    def __repr__(self) -> str:
-        """
-        Return a string representation of the DocType.
-
-        Returns:
-            str: The string representation of the DocType.
-        """
-        return self.render()
-
-    def render(self) -> str:
-        """
-        Render the DocType.
+            name (str): The tag name, case-insensitive.
 
         Returns:
-            str: The rendered DocType.
-        """
-        return f"<!DOCTYPE {self.doc_type}>"
+            type: The Element subclass for the tag.
+        """
+        key = name.lower()
+        tag_cls = _TAG_CLASS_REGISTRY.get(key)
+        if tag_cls is None:
+            class_name = _TAG_SPEC_BY_TAG.get(key)
+            if class_name is not None:
+                tag_cls = __getattr__(class_name)
+            else:
+                tag_cls = _make_tag_class(key.capitalize(), key, True)
+        return tag_cls
 
 
-class Dt(Element):
+def make(name: str, *tags: Union[str, Element], **props: object) -> Element:
     """
-    Represents the <dt> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Dt element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <dt> tag.
-            **props: Additional properties for the <dt> tag.
-        """
-        super().__init__(tag_name="dt", *tags, **props)
+    Build an element for a tag name with one dict lookup.
 
+    Faster counterpart to getattr-based dispatch for hot builders:
+    known tags resolve straight through the class registry, unknown
+    ones fall back to Tag[...] creation and are cached for next time.
 
-class Ellipse(Element):
-    """
-    Represents the <ellipse> SVG element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Ellipse element.
+    Args:
+        name (str): The tag name, case-insensitive.
+        *tags (str, Element): The list of tags to make content of the tag.
+        **props: Properties for the tag.
 
-        Args:
-            **props: Additional properties for the <ellipse> tag.
-        """
-        super().__init__(tag_name="ellipse", has_end_tag=False, **props)
-
-
-class Em(Element):
-    """
-    Represents the <em> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Em element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <em> tag.
-            **props: Additional properties for the <em> tag.
-        """
-        super().__init__(tag_name="em", *tags, **props)
-
-
-class Embed(Element):
-    """
-    Represents the <embed> HTML element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Embed element.
-
-        Args:
-            **props: Additional properties for the <embed> tag.
-        """
-        super().__init__(tag_name="embed", has_end_tag=False, **props)
-
-
-class FieldSet(Element):
-    """
-    Represents the <fieldset> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the FieldSet element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <fieldset> tag.
-            **props: Additional properties for the <fieldset> tag.
-        """
-        super().__init__(tag_name="fieldset", *tags, **props)
-
-
-class FigCaption(Element):
-    """
-    Represents the <figcaption> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the FigCaption element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <figcaption> tag.
-            **props: Additional properties for the <figcaption> tag.
-        """
-        super().__init__(tag_name="figcaption", *tags, **props)
-
-
-class Figure(Element):
-    """
-    Represents the <figure> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Figure element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <figure> tag.
-            **props: Additional properties for the <figure> tag.
-        """
-        super().__init__(tag_name="figure", *tags, **props)
-
-
-class Footer(Element):
-    """
-    Represents the <footer> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Footer element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <footer> tag.
-            **props: Additional properties for the <footer> tag.
-        """
-        super().__init__(tag_name="footer", *tags, **props)
-
-
-class Form(Element):
-    """
-    Represents the <form> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Form element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <form> tag.
-            **props: Additional properties for the <form> tag.
-        """
-        super().__init__(tag_name="form", *tags, **props)
-
-
-class H(Element):
-    """
-    Represents a heading (h1 - h6) HTML element.
-    """
-
-    def __init__(
-        self,
-        level: int = 1,
-        *tags: Union[Iterable[str], Iterable[Element]],
-        **props,
-    ):
-        """
-        Initialize the H element.
-
-        Args:
-            level (int): The level of the heading (1-6).
-            *tags (str, Element): The list of tags to make content to be added to the <h1>-<h6> tag.
-            **props: Additional properties for the heading tag.
-        """
-        if not 1 <= level <= 6:
-            raise ValueError(
-                "The heading level must be an integer in range 1-6."
-            )
-        super().__init__(tag_name=f"h{level}", *tags, **props)
-
-
-class Head(Element):
-    """
-    Represents the <head> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the head element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <head> tag.
-            **props: Additional properties for the <head> tag.
-        """
-        super().__init__(tag_name="head", *tags, **props)
-
-
-class Header(Element):
-    """
-    Represents the <header> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Header element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <header> tag.
-            **props: Additional properties for the <header> tag.
-        """
-        super().__init__(tag_name="header", *tags, **props)
-
-
-class HGroup(Element):
-    """
-    Represents the <hgroup> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the HGroup element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <hgroup> tag.
-            **props: Additional properties for the <hgroup> tag.
-        """
-        super().__init__(tag_name="hgroup", *tags, **props)
-
-
-class Hr(Element):
-    """
-    Represents the <hr> HTML element.
-    """
-
-    def __init__(self):
-        """
-        Initialize the Hr element.
-        """
-        super().__init__(tag_name="hr", has_end_tag=False)
-
-
-class Html(Element):
-    """
-    Represents the <html> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Html element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <html> tag.
-            **props: Additional properties for the <html> tag.
-        """
-        super().__init__(tag_name="html", *tags, **props)
-
-
-class I(Element):
-    """
-    Represents the <i> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the i element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <i> tag.
-            **props: Additional properties for the <i> tag.
-        """
-        super().__init__(tag_name="i", *tags, **props)
-
-
-class IFrame(Element):
-    """
-    Represents the <iframe> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the IFrame element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <iframe> tag.
-            **props: Additional properties for the <iframe> tag.
-        """
-        super().__init__(tag_name="iframe", *tags, **props)
-
-
-class Img(Element):
-    """
-    Represents the <img> HTML element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Img element.
-
-        Args:
-            src (str): The source URL of the image.
-            **props: Additional properties for the <img> tag.
-        """
-        super().__init__(tag_name="img", has_end_tag=False, **props)
-
-
-class Input(Element):
-    """
-    Represents the <input> HTML element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Input element.
-
-        Args:
-            **props: Additional properties for the <input> tag.
-        """
-        super().__init__(tag_name="input", has_end_tag=False, **props)
-
-
-class Ins(Element):
-    """
-    Represents the <ins> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Ins element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <ins> tag.
-            **props: Additional properties for the <ins> tag.
-        """
-        super().__init__(tag_name="ins", *tags, **props)
-
-
-class Kbd(Element):
-    """
-    Represents the <kbd> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Kbd element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <kbd> tag.
-            **props: Additional properties for the <kbd> tag.
-        """
-        super().__init__(tag_name="kbd", *tags, **props)
-
-
-class Label(Element):
-    """
-    Represents the <label> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Label element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <label> tag.
-            **props: Additional properties for the <label> tag.
-        """
-        super().__init__(tag_name="label", *tags, **props)
-
-
-class Legend(Element):
-    """
-    Represents the <legend> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Legend element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <legend> tag.
-            **props: Additional properties for the <legend> tag.
-        """
-        super().__init__(tag_name="legend", *tags, **props)
-
-
-class Li(Element):
-    """
-    Represents the <li> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Li element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <li> tag.
-            **props: Additional properties for the <li> tag.
-        """
-        super().__init__(tag_name="li", *tags, **props)
-
-
-class LinearGradient(Element):
-    """
-    Represents the <linearGradient> SVG element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the LinearGradient element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <linearGradient> tag.
-            **props: Additional properties for the <linearGradient> tag.
-        """
-        super().__init__(tag_name="linearGradient", *tags, **props)
-
-
-class Link(Element):
-    """
-    Represents the <link> HTML element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Link element.
-
-        Args:
-            **props: Additional properties for the <link> tag.
-        """
-        super().__init__(tag_name="link", has_end_tag=False, **props)
-
-
-class Main(Element):
-    """
-    Represents the <main> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Main element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <main> tag.
-            **props: Additional properties for the <main> tag.
-        """
-        super().__init__(tag_name="main", *tags, **props)
-
-
-class Map(Element):
-    """
-    Represents the <map> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Map element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <map> tag.
-            **props: Additional properties for the <map> tag.
-        """
-        super().__init__(tag_name="map", *tags, **props)
-
-
-class Mark(Element):
-    """
-    Represents the <mark> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Mark element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <mark> tag.
-            **props: Additional properties for the <mark> tag.
-        """
-        super().__init__(tag_name="mark", *tags, **props)
-
-
-class Menu(Element):
-    """
-    Represents the <menu> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Menu element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <menu> tag.
-            **props: Additional properties for the <menu> tag.
-        """
-        super().__init__(tag_name="menu", *tags, **props)
-
-
-class Meta(Element):
-    """
-    Represents the <meta> HTML element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Meta element.
-
-        Args:
-            **props: Additional properties for the <meta> tag.
-        """
-        super().__init__(tag_name="meta", has_end_tag=False, **props)
-
-
-class Meter(Element):
-    """
-    Represents the <meter> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Meter element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <meter> tag.
-            **props: Additional properties for the <meter> tag.
-        """
-        super().__init__(tag_name="meter", *tags, **props)
-
-
-class Nav(Element):
-    """
-    Represents the <nav> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Nav element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <nav> tag.
-            **props: Additional properties for the <nav> tag.
-        """
-        super().__init__(tag_name="nav", *tags, **props)
-
-
-class NoScript(Element):
-    """
-    Represents the <noscript> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the NoScript element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <noscript> tag.
-            **props: Additional properties for the <noscript> tag.
-        """
-        super().__init__(tag_name="noscript", *tags, **props)
-
-
-class Object(Element):
-    """
-    Represents the <object> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Object element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <object> tag.
-            **props: Additional properties for the <object> tag.
-        """
-        super().__init__(tag_name="option", *tags, **props)
-
-
-class Ol(Element):
-    """
-    Represents the <ol> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Ol element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <ol> tag.
-            **props: Additional properties for the <ol> tag.
-        """
-        super().__init__(tag_name="ol", *tags, **props)
-
-
-class OptGroup(Element):
-    """
-    Represents the <optgroup> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the OptGroup element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <optgroup> tag.
-            **props: Additional properties for the <optgroup> tag.
-        """
-        super().__init__(tag_name="optgroup", *tags, **props)
-
-
-class Option(Element):
-    """
-    Represents the <option> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Option element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <option> tag.
-            **props: Additional properties for the <option> tag.
-        """
-        super().__init__(tag_name="option", *tags, **props)
-
-
-class Output(Element):
-    """
-    Represents the <output> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Output element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <output> tag.
-            **props: Additional properties for the <output> tag.
-        """
-        super().__init__(tag_name="output", *tags, **props)
-
-
-class P(Element):
-    """
-    Represents the <p> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the P element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <p> tag.
-            **props: Additional properties for the <p> tag.
-        """
-        super().__init__(tag_name="p", *tags, **props)
-
-
-class Param(Element):
-    """
-    Represents the <param> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Param element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <param> tag.
-            **props: Additional properties for the <param> tag.
-        """
-        super().__init__(tag_name="param", *tags, **props)
-
-
-class Picture(Element):
-    """
-    Represents the <picture> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Picture element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <picture> tag.
-            **props: Additional properties for the <picture> tag.
-        """
-        super().__init__(tag_name="picture", *tags, **props)
-
-
-class Polygon(Element):
-    """
-    Represents the <polygon> SVG element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Polygon element.
-
-        Args:
-            **props: Additional properties for the <polygon> tag.
-        """
-        super().__init__(tag_name="polygon", has_end_tag=False, **props)
-
-
-class Pre(Element):
-    """
-    Represents the <pre> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Pre element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <pre> tag.
-            **props: Additional properties for the <pre> tag.
-        """
-        super().__init__(tag_name="pre", *tags, **props)
-
-
-class Progress(Element):
-    """
-    Represents the <progress> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Progress element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <progress> tag.
-            **props: Additional properties for the <progress> tag.
-        """
-        super().__init__(tag_name="progress", *tags, **props)
-
-
-class Q(Element):
-    """
-    Represents the <q> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Q element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <q> tag.
-            **props: Additional properties for the <q> tag.
-        """
-        super().__init__(tag_name="q", *tags, **props)
-
-
-class Rect(Element):
-    """
-    Represents the <rect> SVG element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Rect element.
-
-        Args:
-            **props: Additional properties for the <rect> tag.
-        """
-        super().__init__(tag_name="rect", has_end_tag=False, **props)
-
-
-class Rp(Element):
-    """
-    Represents the <rp> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Rp element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <rp> tag.
-            **props: Additional properties for the <rp> tag.
-        """
-        super().__init__(tag_name="rp", *tags, **props)
-
-
-class Rt(Element):
-    """
-    Represents the <rt> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Rt element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <rt> tag.
-            **props: Additional properties for the <rt> tag.
-        """
-        super().__init__(tag_name="rt", *tags, **props)
-
-
-class Ruby(Element):
-    """
-    Represents the <ruby> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Ruby element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <ruby> tag.
-            **props: Additional properties for the <ruby> tag.
-        """
-        super().__init__(tag_name="ruby", *tags, **props)
-
-
-class S(Element):
-    """
-    Represents the <s> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the S element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <s> tag.
-            **props: Additional properties for the <s> tag.
-        """
-        super().__init__(tag_name="s", *tags, **props)
-
-
-class Samp(Element):
-    """
-    Represents the <samp> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Samp element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <samp> tag.
-            **props: Additional properties for the <samp> tag.
-        """
-        super().__init__(tag_name="samp", *tags, **props)
-
-
-class Script(Element):
-    """
-    Represents the <script> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Script element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <script> tag.
-            **props: Additional properties for the <script> tag.
-        """
-        super().__init__(tag_name="script", *tags, **props)
-
-
-class Search(Element):
-    """
-    Represents the <search> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Search element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <search> tag.
-            **props: Additional properties for the <search> tag.
-        """
-        super().__init__(tag_name="search", *tags, **props)
-
-
-class Section(Element):
-    """
-    Represents the <section> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Section element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <section> tag.
-            **props: Additional properties for the <section> tag.
-        """
-        super().__init__(tag_name="section", *tags, **props)
-
-
-class Select(Element):
-    """
-    Represents the <select> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Select element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <select> tag.
-            **props: Additional properties for the <select> tag.
-        """
-        super().__init__(tag_name="select", *tags, **props)
-
-
-class Small(Element):
-    """
-    Represents the <small> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Small element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <small> tag.
-            **props: Additional properties for the <small> tag.
-        """
-        super().__init__(tag_name="small", *tags, **props)
-
-
-class Source(Element):
-    """
-    Represents the <source> HTML element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Source element.
-
-        Args:
-            **props: Additional properties for the <source> tag.
-        """
-        super().__init__(tag_name="source", has_end_tag=False, **props)
-
-
-class Span(Element):
-    """
-    Represents the <span> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Span element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <span> tag.
-            **props: Additional properties for the <span> tag.
-        """
-        super().__init__(tag_name="span", *tags, **props)
-
-
-class Stop(Element):
-    """
-    Represents the <stop> SVG element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Stop element.
-
-        Args:
-            **props: Additional properties for the <stop> tag.
-        """
-        super().__init__(tag_name="stop", has_end_tag=False, **props)
-
-
-class Strong(Element):
-    """
-    Represents the <strong> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Strong element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <strong> tag.
-            **props: Additional properties for the <strong> tag.
-        """
-        super().__init__(tag_name="strong", *tags, **props)
-
-
-class Style(Element):
-    """
-    Represents the <style> HTML element.
-    """
-
-    def __init__(self, **props):
-        """
-        Initialize the Style element.
-
-        Args:
-            **props: Additional properties for the <style> tag.
-        """
-        tag_content = ""
-        for key, value in props.items():
-            if isinstance(value, dict):
-                val = "".join(
-                    f"{k.replace('_', '-')}: {v};" for k, v in value.items()
-                )
-                tag_content += f"{key} {val}"
-            elif isinstance(value, str):
-                tag_content += f"{key} {value}"
-
-            else:
-                raise TypeError("property must be string or dict.")
-        super().__init__(tag_name="style", tags=(tag_content,), **props)
-
-
-class Sub(Element):
-    """
-    Represents the <sub> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the <sub> element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <sub> tag.
-            **props: Additional properties for the <sub> tag.
-        """
-        super().__init__(tag_name="sub", *tags, **props)
-
-
-class Summary(Element):
-    """
-    Represents the <summary> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Summary element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <summary> tag.
-            **props: Additional properties for the <summary> tag.
-        """
-        super().__init__(tag_name="summary", *tags, **props)
-
-
-class Sup(Element):
-    """
-    Represents the <sup> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Sup element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <sup> tag.
-            **props: Additional properties for the <sup> tag.
-        """
-        super().__init__(tag_name="sup", *tags, **props)
-
-
-class Svg(Element):
-    """
-    Represents the <svg> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Svg element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <svg> tag.
-            **props: Additional properties for the <svg> tag.
-        """
-        super().__init__(tag_name="svg", *tags, **props)
-
-
-class Table(Element):
-    """
-    Represents the <table> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Table element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <table> tag.
-            **props: Additional properties for the <table> tag.
-        """
-        super().__init__(tag_name="table", *tags, **props)
-
-
-class TBody(Element):
-    """
-    Represents the <tbody> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the TBody element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <tbody> tag.
-            **props: Additional properties for the <tbody> tag.
-        """
-        super().__init__(tag_name="tbody", *tags, **props)
-
-
-class Td(Element):
-    """
-    Represents the <td> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Td element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <td> tag.
-            **props: Additional properties for the <td> tag.
-        """
-        super().__init__(tag_name="td", *tags, **props)
-
-
-class Template(Element):
-    """
-    Represents the <template> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Template element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <template> tag.
-            **props: Additional properties for the <template> tag.
-        """
-        super().__init__(tag_name="template", *tags, **props)
-
-
-class Text(Element):
-    """
-    Represents the <text> SVG element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Text element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <text> tag.
-            **props: Additional properties for the <text> tag.
-        """
-        super().__init__(tag_name="text", *tags, **props)
-
-
-class Textarea(Element):
-    """
-    Represents the <textarea> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Textarea element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <textarea> tag.
-            **props: Additional properties for the <textarea> tag.
-        """
-        super().__init__(tag_name="textarea", *tags, **props)
-
-
-class TFoot(Element):
-    """
-    Represents the <tfoot> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the TFoot element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <tfoot> tag.
-            **props: Additional properties for the <tfoot> tag.
-        """
-        super().__init__(tag_name="tfoot", *tags, **props)
-
-
-class Th(Element):
-    """
-    Represents the <th> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the th element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <th> tag.
-            **props: Additional properties for the <th> tag.
-        """
-        super().__init__(tag_name="th", *tags, **props)
-
-
-class THead(Element):
-    """
-    Represents the <thead> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the THead element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <thead> tag.
-            **props: Additional properties for the <thead> tag.
-        """
-        super().__init__(tag_name="thead", *tags, **props)
-
-
-class Time(Element):
-    """
-    Represents the <time> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Time element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <time> tag.
-            **props: Additional properties for the <time> tag.
-        """
-        super().__init__(tag_name="time", *tags, **props)
-
-
-class Title(Element):
-    """
-    Represents the <title> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Title element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <title> tag.
-            **props: Additional properties for the <title> tag.
-        """
-        super().__init__(tag_name="title", *tags, **props)
-
-
-class Tr(Element):
-    """
-    Represents the <tr> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the tr element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <tr> tag.
-            **props: Additional properties for the <tr> tag.
-        """
-        super().__init__(tag_name="tr", *tags, **props)
-
-
-class Track(Element):
-    """
-    Represents the <track> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Track element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <track> tag.
-            **props: Additional properties for the <track> tag.
-        """
-        super().__init__(tag_name="track", *tags, **props)
-
-
-class U(Element):
-    """
-    Represents the <u> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the U element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <u> tag.
-            **props: Additional properties for the <u> tag.
-        """
-        super().__init__(tag_name="u", *tags, **props)
-
-
-class Ul(Element):
-    """
-    Represents the <ul> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Ul element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <ul> tag.
-            **props: Additional properties for the <ul> tag.
-        """
-        super().__init__(tag_name="ul", *tags, **props)
-
-
-class Var(Element):
-    """
-    Represents the <var> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Var element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <var> tag.
-            **props: Additional properties for the <var> tag.
-        """
-        super().__init__(tag_name="var", *tags, **props)
-
-
-class Video(Element):
-    """
-    Represents the <video> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Video element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <video> tag.
-            **props: Additional properties for the <video> tag.
-        """
-        super().__init__(tag_name="video", *tags, **props)
-
-
-class Wbr(Element):
-    """
-    Represents the <wbr> HTML element.
-    """
-
-    def __init__(
-        self, *tags: Union[Iterable[str], Iterable[Element]], **props
-    ):
-        """
-        Initialize the Wbr element.
-
-        Args:
-            *tags (str, Element): The list of tags to make content to be added to the <wbr> tag.
-            **props: Additional properties for the <wbr> tag.
-        """
-        super().__init__(tag_name="wbr", *tags, **props)
+    Returns:
+        Element: An instance of the class rendering the tag.
+    """
+    tag_cls = _TAG_CLASS_REGISTRY.get(name) or Tag[name]
+    return tag_cls(*tags, **props)
+
+
+#: Star imports materialize everything; plain attribute access stays
+#: lazy.
+__all__ = sorted(
+    {
+        name
+        for name, value in list(globals().items())
+        if isinstance(value, type) and not name.startswith("_")
+        # Imported stdlib classes (deque, ...) are module globals too;
+        # only the library's own types belong in the export surface.
+        and (issubclass(value, Element) or value in (Comment, DocType))
+    }
+    | set(_TAG_SPECS)
+    | {"make"}
+)
@@ -0,0 +1,205 @@
+from typing import Callable, Optional, Union
+
+__all__: list[str]
+
+class Element:
+    TAG_NAME: str
+    HAS_END_TAG: bool
+    tag_name: str
+    has_end_tag: bool
+    tag_content: str
+    children: list
+    properties: dict
+    def __init__(
+        self,
+        *tags: Union[str, "Element"],
+        tag_name: Optional[str] = ...,
+        has_end_tag: Optional[bool] = ...,
+        tag_content: Union[str, "Element"] = ...,
+        children: Optional[list] = ...,
+        **props: object,
+    ) -> None: ...
+    def __add__(self, other: Union[str, "Element"]) -> "Element": ...
+    def render(self) -> str: ...
+    def render_into(self, write: Callable[[str], object]) -> None: ...
+    def write(self, out) -> None: ...
+    def pretty_into(
+        self, buf: list, indent: int = ..., level: int = ...
+    ) -> None: ...
+    def compile(self) -> Callable[[], str]: ...
+    @classmethod
+    def acquire(
+        cls, *tags: Union[str, "Element"], **props: object
+    ) -> "Element": ...
+    @classmethod
+    def release(cls, obj: "Element") -> None: ...
+    @classmethod
+    def preallocate(cls, count: int) -> None: ...
+    def recycle(self) -> None: ...
+    def add_property(self, name: str, value: str) -> None: ...
+    def add_properties(self, **props: object) -> None: ...
+    def add_style(self, name: str, value: str) -> None: ...
+    def add_styles(self, **styles: object) -> None: ...
+    def add_content(self, *tags: Union[str, "Element"]) -> None: ...
+    @property
+    def props(self) -> str: ...
+    @property
+    def style(self) -> str: ...
+    @property
+    def text(self) -> str: ...
+
+class A(Element):
+    def __init__(
+        self, link: str, *tags: Union[str, Element], **props: object
+    ) -> None: ...
+
+class Br(Element): ...
+class Hr(Element): ...
+
+class Style(Element):
+    def __init__(self, **props: object) -> None: ...
+
+# H dispatches to one of the H1-H6 classes and never produces an H
+# instance, which a class-level __new__ annotation cannot express.
+def H(
+    level: int = ..., *tags: Union[str, Element], **props: object
+) -> Element: ...
+
+class H1(Element): ...
+class H2(Element): ...
+class H3(Element): ...
+class H4(Element): ...
+class H5(Element): ...
+class H6(Element): ...
+
+class Comment:
+    tag_content: str
+    multiline: bool
+    def __init__(self, *tags: Union[str, Element]) -> None: ...
+    def render(self) -> str: ...
+    def write(self, out) -> None: ...
+
+class DocType:
+    doc_type: str
+    def __new__(cls, doc_type: str = ...) -> "DocType": ...
+    def render(self) -> str: ...
+    def write(self, out) -> None: ...
+
+class Tag(Element):
+    def __class_getitem__(cls, name: str) -> type: ...
+
+def make(
+    name: str, *tags: Union[str, Element], **props: object
+) -> Element: ...
+
+class Abbr(Element): ...
+class Address(Element): ...
+class Area(Element): ...
+class Article(Element): ...
+class Aside(Element): ...
+class Audio(Element): ...
+class B(Element): ...
+class Base(Element): ...
+class Bdi(Element): ...
+class Bdo(Element): ...
+class BlockQuote(Element): ...
+class Body(Element): ...
+class Button(Element): ...
+class Canvas(Element): ...
+class Caption(Element): ...
+class Circle(Element): ...
+class Cite(Element): ...
+class Code(Element): ...
+class Col(Element): ...
+class ColGroup(Element): ...
+class Data(Element): ...
+class DataIterable(Element): ...
+class Dd(Element): ...
+class Defs(Element): ...
+class Del(Element): ...
+class Details(Element): ...
+class Dfn(Element): ...
+class Dialog(Element): ...
+class Div(Element): ...
+class Dl(Element): ...
+class Dt(Element): ...
+class Ellipse(Element): ...
+class Em(Element): ...
+class Embed(Element): ...
+class FieldSet(Element): ...
+class FigCaption(Element): ...
+class Figure(Element): ...
+class Footer(Element): ...
+class Form(Element): ...
+class Head(Element): ...
+class Header(Element): ...
+class HGroup(Element): ...
+class Html(Element): ...
+class I(Element): ...
+class IFrame(Element): ...
+class Img(Element): ...
+class Input(Element): ...
+class Ins(Element): ...
+class Kbd(Element): ...
+class Label(Element): ...
+class Legend(Element): ...
+class Li(Element): ...
+class LinearGradient(Element): ...
+class Link(Element): ...
+class Main(Element): ...
+class Map(Element): ...
+class Mark(Element): ...
+class Menu(Element): ...
+class Meta(Element): ...
+class Meter(Element): ...
+class Nav(Element): ...
+class NoScript(Element): ...
+class Object(Element): ...
+class Ol(Element): ...
+class OptGroup(Element): ...
+class Option(Element): ...
+class Output(Element): ...
+class P(Element): ...
+class Param(Element): ...
+class Picture(Element): ...
+class Polygon(Element): ...
+class Pre(Element): ...
+class Progress(Element): ...
+class Q(Element): ...
+class Rect(Element): ...
+class Rp(Element): ...
+class Rt(Element): ...
+class Ruby(Element): ...
+class S(Element): ...
+class Samp(Element): ...
+class Script(Element): ...
+class Search(Element): ...
+class Section(Element): ...
+class Select(Element): ...
+class Small(Element): ...
+class Source(Element): ...
+class Span(Element): ...
+class Stop(Element): ...
+class Strong(Element): ...
+class Sub(Element): ...
+class Summary(Element): ...
+class Sup(Element): ...
+class Svg(Element): ...
+class Table(Element): ...
+class TBody(Element): ...
+class Td(Element): ...
+class Template(Element): ...
+class Text(Element): ...
+class Textarea(Element): ...
+class TFoot(Element): ...
+class Th(Element): ...
+class THead(Element): ...
+class Time(Element): ...
+class Title(Element): ...
+class Tr(Element): ...
+class Track(Element): ...
+class U(Element): ...
+class Ul(Element): ...
+class Var(Element): ...
+class Video(Element): ...
+class Wbr(Element): ...